@@ -51,6 +51,7 @@ from PySide2.QtGui     import ( QBrush,
 from PySide2.QtCore    import ( Signal,
                                 Slot,
                                 Qt,
+                                QEvent,
                                 QModelIndex, QMimeData,
                                 QTimer)
 from PySide2.QtWidgets import ( QHBoxLayout,
@@ -120,9 +121,10 @@ class ActionButton(QPushButton):
 
     def __init__(self, action: Action):
         """
-        Init self with an instance of the class Action. Set text,
-        tooltip and keep the given action as an attribute. When self is
-        clicked on, emit the signal self.action_triggered.
+        Init self with an instance of the class Action. Set text and
+        keep the given action as an attribute; the tooltip is built by
+        self.event() on the first QEvent.ToolTip. When self is clicked
+        on, emit the signal self.action_triggered.
 
         :param action: The instance of the class Action one wants
             self to be associated with.
@@ -141,7 +143,7 @@ class ActionButton(QPushButton):
             self.setPalette(palette)
 
         self.action = action
-        self.update()  # set symbol and tool tip
+        self.update()  # Set symbol (tool tip is set by self.event())
         self.clicked.connect(self._emit_action)
         # Modify arrow appearance when over a button
         self.setCursor(QCursor(Qt.PointingHandCursor))
@@ -151,14 +153,30 @@ class ActionButton(QPushButton):
 
     def update(self):
         """
-        Set or update text and tooltips in button, using module pylib.text.
+        Set or update text in button, using module pylib.text.
+        The tooltip is only computed when it is first needed, see
+        self.event().
         NB: translation is done here.
         """
         name = self.action.name
         symbol = _(button_symbol(name))
         self.setText(symbol)
+        self.tool_tip_is_set = False
 
-        tool_tip = button_tool_tip(name)
+    def event(self, event: QEvent) -> bool:
+        """
+        Set the tooltip just before it is displayed for the first time.
+        """
+        if event.type() == QEvent.ToolTip and not self.tool_tip_is_set:
+            self.set_tool_tip()
+        return super().event(event)
+
+    def set_tool_tip(self):
+        """
+        Set tooltip in button, using module pylib.text.
+        NB: translation is done here.
+        """
+        tool_tip = button_tool_tip(self.action.name)
         if isinstance(tool_tip, str):
             tooltip = _(tool_tip)
         elif isinstance(tool_tip, list):
@@ -173,6 +191,7 @@ class ActionButton(QPushButton):
         else:
             tooltip = ""
         self.setToolTip(tooltip)
+        self.tool_tip_is_set = True
 
     @Slot()
     def _emit_action(self):
@@ -68,12 +68,12 @@ class YesNoDialog(QMessageBox):
         self.__yes = False
         # self.setStandardButtons(QMessageBox.No | QMessageBox.Yes)
         self.addButton(QMessageBox.No)
-        self.addButton(QMessageBox.Yes)
-        self.button(QMessageBox.Yes).clicked.connect(self._set_yes_True)
+        yes_button = self.addButton(QMessageBox.Yes)
+        yes_button.clicked.connect(self._set_yes_True)
         self.setButtonText(QMessageBox.Yes, _("Yes"))
         self.setButtonText(QMessageBox.No, _("No"))
 
-    @Slot()
+    @Slot(name="_set_yes_True")
     def _set_yes_True(self):
         """
         Set self.__yes to True. This slot is called when the Yes button
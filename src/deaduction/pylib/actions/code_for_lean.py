@@ -229,6 +229,11 @@ class CodeForLean:
 
         :param instructions: list of CodeForLean, str, or tuple.
         """
+        if not instructions:
+            return cls(instructions=[],
+                       error_msg=error_msg,
+                       success_msg=global_success_msg)
+
         for i in range(len(instructions)):
             if isinstance(instructions[i], str):
                 instructions[i] = CodeForLean(instructions[i])
@@ -487,12 +492,9 @@ class CodeForLean:
             # else:
             #     return code
         elif self.is_and_then():
-            strings = []
-            for instruction in self.instructions:
-                string = instruction.to_code(exclude_no_meta_vars)
-                if string:
-                    strings.append(string)
-            return ', '.join(strings)
+            strings = (instruction.to_code(exclude_no_meta_vars)
+                       for instruction in self.instructions)
+            return ', '.join(string for string in strings if string)
         elif self.is_or_else():
             strings = [child.to_code(exclude_no_meta_vars)
                        for child in self.instructions]
@@ -716,7 +718,7 @@ class CodeForLean:
         elif self.is_or_else():
             return True
         else:
-            return True in [code_.has_or_else() for code_ in self.instructions]
+            return any(code_.has_or_else() for code_ in self.instructions)
 
     def could_have_meta_vars(self) -> bool:
         if self.is_empty():
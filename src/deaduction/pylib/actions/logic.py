@@ -511,26 +511,13 @@ def have_new_property(arrow: MathObject,
     #  May even try to guess parameters from the context
     #  (e.g. if we need a function and there is only one in the context)
     selected_hypo = arrow.info["name"]
-
-    command = f'have {new_hypo_name} := {selected_hypo}'
-    command_explicit = f'have {new_hypo_name} := @{selected_hypo}'
-
     arguments = ' '.join(variable_names)
 
-    # try with up to 4 implicit parameters
-    implicit_codes = [command + ' ' + arguments,
-                      command + ' _ ' + arguments,
-                      command + ' _ _ ' + arguments,
-                      command + ' _ _ _ ' + arguments,
-                      command + ' _ _ _ _ ' + arguments]
-
-    explicit_codes = [command_explicit + ' ' + arguments,
-                      command_explicit + ' _ ' + arguments,
-                      command_explicit + ' _ _ ' + arguments,
-                      command_explicit + ' _ _ _ ' + arguments,
-                      command_explicit + ' _ _ _ _ ' + arguments]
-
-    possible_codes = implicit_codes + explicit_codes
+    # Try with up to 4 implicit parameters, first without then with '@'
+    possible_codes = [f'have {new_hypo_name} := {prefix}{selected_hypo} '
+                      + '_ ' * nb_placeholders + arguments
+                      for prefix in ('', '@')
+                      for nb_placeholders in range(5)]
 
     code = CodeForLean.or_else_from_list(possible_codes)
     if success_msg is None:
@@ -591,22 +578,22 @@ def action_implies(proof_step) -> CodeForLean:
         else:
             return construct_implies(proof_step)
     if len(selected_objects) == 1:
+        implication = selected_objects[0]
         # (1) Implication?
-        if not selected_objects[0].can_be_used_for_implication(implicit=True):
+        if not implication.can_be_used_for_implication(implicit=True):
             raise WrongUserInput(
                 error=_("Selected property is not an implication 'P ⇒ Q'"))
         # (2) 'It suffices to prove'?
         elif target_selected:
             return apply_implies(proof_step, selected_objects)
+        premise = implication.premise()
         # (3) Premise in context (but not selected)?
-        elif selected_objects[0].premise() in ([p.math_type
-                                               for p in goal.context_props]
-                                               + [goal.target.math_type]):
+        if premise == goal.target.math_type or \
+                any(premise == p.math_type for p in goal.context_props):
             raise WrongUserInput(error=_("You need to select another property"
                                          "in order to apply this implication"))
         # (4) Ask to add premise as a new sub_goal
         elif not user_input:
-            premise = selected_objects[0].premise()
             raw_msg = 'To apply this property, you need the premise \"{}\". '\
                 'Do you want to prove it?'
             msg = _(raw_msg).format(premise.to_display(format_='utf8'))
@@ -729,12 +716,11 @@ def destruct_iff_on_hyp(proof_step,
     Split a property 'P iff Q' into two implications.
     len(selected_objects) should be 1.
     """
-    possible_codes = []
     hypo_name = selected_objects[0].info["name"]
     h1 = get_new_hyp(proof_step)
     h2 = get_new_hyp(proof_step)
-    possible_codes.append(f'cases (iff_def.mp {hypo_name}) with {h1} {h2}')
-    code = CodeForLean.or_else_from_list(possible_codes)
+    code = CodeForLean.from_string(f'cases (iff_def.mp {hypo_name}) '
+                                   f'with {h1} {h2}')
     code.add_success_msg(_("Property {} split into {} and {}").
                              format(hypo_name, h1, h2))
     return code
@@ -1400,12 +1386,12 @@ def construct_exists_on_hyp(proof_step,
 
     x = selected_objects[0].info["name"]
     hx = selected_objects[1].info["name"]
-    if (not selected_objects[0].math_type.is_prop()) \
-            and selected_objects[1].math_type.is_prop():
+    is_prop0 = selected_objects[0].math_type.is_prop()
+    is_prop1 = selected_objects[1].math_type.is_prop()
+    if not is_prop0 and is_prop1:
         new_hypo = get_new_hyp(proof_step)
         code_string = f'have {new_hypo} := exists.intro {x} {hx}'
-    elif (not selected_objects[1].math_type.is_prop()) \
-            and selected_objects[0].math_type.is_prop():
+    elif not is_prop1 and is_prop0:
         x, hx = hx, x
         new_hypo = get_new_hyp(proof_step)
         code_string = f'have {new_hypo} := exists.intro {x} {hx}'
@@ -1495,14 +1481,12 @@ def code_for_substitution(rw_hyp: MathObject,
 
     reverse_code = " <- " if reverse else " "
     rw_code = "rw" + reverse_code + "{}"
-    used_hyp = [rw_hyp]
+    used_hyp = [rw_hyp_name]
     if on_hyp:
-        used_hyp.append(on_hyp)
+        used_hyp.append(on_hyp_name)
         rw_code += " at {}"
 
     simp_rw_code = "simp_" + rw_code
-    # Replace hyp by their names:
-    used_hyp = [hyp.info["name"] for hyp in used_hyp]
     code_strings = [rw_code.format(*used_hyp), simp_rw_code.format(*used_hyp)]
     code = CodeForLean.or_else_from_list(code_strings)
     code.add_success_msg(success_msg)
@@ -1553,8 +1537,7 @@ def apply_substitute(proof_step,
                                                   reverse=True)
             codes = codes.or_else(more_code)
         else:  # Choice of substitution direction has not been made
-            if goal.target.math_type.contains(left) and \
-                    goal.target.math_type.contains(right):
+            if goal.target.math_type.contains_both(left, right):
                 # Choice needed
                 raise MissingParametersError(
                     InputType.Choice,
@@ -1585,8 +1568,8 @@ def apply_substitute(proof_step,
                                                   reverse=True)
                 codes = codes.or_else(more_code)
         else:
-            if prop.math_type.contains(left) and \
-                    prop.math_type.contains(right):  # Both directions work
+            if prop.math_type.contains_both(left, right):
+                # Both directions work
                 raise MissingParametersError(
                     InputType.Choice,
                     choices,
@@ -1753,25 +1736,22 @@ def apply_function(proof_step, map_, arguments: [MathObject]):
     f = map_.info["name"]
 
     other_names = []
-    while arguments:
-
-        if arguments[0].math_type.is_prop():
+    for argument in arguments:
+        name = argument.info["name"]
+        if argument.math_type.is_prop():
             # Function applied to a property, presumed to be an equality
-            h = arguments[0].info["name"]
             new_h = get_new_hyp(proof_step)
             other_names.extend(new_h)
-            codes = codes.and_then(f'have {new_h} := congr_arg {f} {h}')
-            codes.add_success_msg(_("Map {} applied to {}").format(f, h))
-            codes.add_used_properties(arguments[0])
+            codes = codes.and_then(f'have {new_h} := congr_arg {f} {name}')
+            codes.add_success_msg(_("Map {} applied to {}").format(f, name))
+            codes.add_used_properties(argument)
         else:
             # Function applied to element x:
             #   create new element y and new equality y=f(x)
-            x = arguments[0].info["name"]
             codes = codes.and_then(apply_map_to_element(proof_step,
                                                         map_,
-                                                        x,
+                                                        name,
                                                         other_names))
-        arguments = arguments[1:]
     msg = (_("The map {} cannot be applied to this object").format(f)
            if len(arguments) == 1 else
            _("The map {} cannot be applied to these objects").format(f))
@@ -192,29 +192,22 @@ def raw_solve_target(target, proof_step, selected_objects) -> CodeForLean:
         code = code.or_else(more_code)
 
     # (2) Equality/iff tactics if pertinent, cf target and context
-    if (target.is_equality(is_math_type=True)
-            or target.is_iff(is_math_type=True)):
-        goal_contains_equalities = True
-    else:
-        goal_contains_equalities = False
-    for math_object in context:
-        if math_object.is_equality():
-            goal_contains_equalities = True
+    goal_contains_equalities = (target.is_equality(is_math_type=True)
+                                or target.is_iff(is_math_type=True)
+                                or any(math_object.is_equality()
+                                       for math_object in context))
 
     if goal_contains_equalities:
         more_code = raw_solve_equality(target)
         code = code.or_else(more_code)
 
     # (3) Computing tactics (beware, this may take a long time!)
-    numbers_involved = False
     if target.is_false(is_math_type=True):
         # Check if numbers are involved somewhere in context
-        context = proof_step.goal.context
-        for math_object in context:
-            if math_object.math_type.concerns_numbers():
-                numbers_involved = True
-    elif target.concerns_numbers():
-        numbers_involved = True
+        numbers_involved = any(math_object.math_type.concerns_numbers()
+                               for math_object in context)
+    else:
+        numbers_involved = target.concerns_numbers()
     if numbers_involved:
         more_code = compute(target)
         code = code.or_else(more_code)
@@ -292,10 +285,7 @@ def modulate_tree(tree, variations: [callable]):
         return None
     elif isinstance(tree, list): # Non empty list
         # Replace child by modulated children
-        modulated_tree = []
-        for child in tree:
-            modulated_tree.append(modulate_tree(child, variations))
-        return modulated_tree
+        return [modulate_tree(child, variations) for child in tree]
     elif isinstance(tree, MathObject):
         return modulate(tree, variations)
     else:  # String or "or_else"
@@ -470,8 +460,6 @@ def action_assumption(proof_step) -> CodeForLean:
 
     # (3) Turn code_tree into CodeForLean
     code = code_from_tree(modulated_tree, selected_objects, proof_step)
-    print("Code :")
-    print(code)
 
     # (4) Add global msg
     code.add_error_msg(_("I don't know how to conclude"))
@@ -27,9 +27,9 @@ This file is part of dEAduction.
 """
 
 import logging
+from functools import lru_cache
 from typing import Union
 
-from deaduction.pylib.text        import tooltips
 # from deaduction.pylib.config.i18n import _
 import deaduction.pylib.config.vars as cvars
 
@@ -50,12 +50,17 @@ from deaduction.pylib.math_display import new_objects, new_properties
 log = logging.getLogger(__name__)
 global _
 
-# # Turn proof_button_texts into a dictionary
-# proof_list = ['action_apply', 'proof_methods', 'new_object']
-# lbt = tooltips.get('proof_button_texts').split(', ')
-# proof_button_texts = {}
-# for key, value in zip(proof_list, lbt):
-#     proof_button_texts[key] = value
+
+@lru_cache(maxsize=1)
+def proof_methods_choices(language: str) -> tuple:
+    """
+    Return the translated choices of proof methods. The result is computed
+    once per language, so that a language switch is taken into account.
+    """
+    choices = (('1', _("Case-based reasoning")),
+               ('2', _("Proof by contraposition")),
+               ('3', _("Proof by contradiction")))
+    return choices
 
 
 @action()
@@ -67,9 +72,8 @@ def action_proof_methods(proof_step) -> CodeForLean:
 
     # 1st call, choose proof method
     if not user_input:
-        choices = [('1', _("Case-based reasoning")),
-                   ('2', _("Proof by contraposition")),
-                   ('3', _("Proof by contradiction"))]
+        language = cvars.get('i18n.select_language', "en")
+        choices = list(proof_methods_choices(language))
         allow_proof_by_sorry = cvars.get('functionality.allow_proof_by_sorry')
         if allow_proof_by_sorry:
             choices.append(('4', _("Admit current sub-goal!")))
@@ -80,15 +84,9 @@ def action_proof_methods(proof_step) -> CodeForLean:
                                      )
     # 2nd call, call the adequate proof method. len(user_input) = 1.
     else:
-        method = user_input[0] + 1
-        if method == 1:
-            return method_cbr(proof_step, selected_objects, user_input)
-        if method == 2:
-            return method_contrapose(proof_step, selected_objects)
-        if method == 3:
-            return method_absurdum(proof_step, selected_objects)
-        if method == 4:
-            return method_sorry(proof_step, selected_objects)
+        method = PROOF_METHODS.get(user_input[0] + 1)
+        if method:
+            return method(proof_step, selected_objects, user_input)
     raise WrongUserInput
 
 
@@ -132,7 +130,8 @@ def method_cbr(proof_step,
 
 
 def method_contrapose(proof_step,
-                      selected_objects: [MathObject]) -> CodeForLean:
+                      selected_objects: [MathObject],
+                      user_input: [str]) -> CodeForLean:
     """
     If target is an implication, turn it to its contrapose.
     If a property P is selected, and target is Q, then assume (not Q) and
@@ -166,7 +165,9 @@ def method_contrapose(proof_step,
     raise WrongUserInput(error)
 
 
-def method_absurdum(proof_step, selected_objects: [MathObject]) -> CodeForLean:
+def method_absurdum(proof_step,
+                    selected_objects: [MathObject],
+                    user_input: [str]) -> CodeForLean:
     """
     If no selection, engage in a proof by contradiction.
     """
@@ -180,13 +181,22 @@ def method_absurdum(proof_step, selected_objects: [MathObject]) -> CodeForLean:
     raise WrongUserInput(error)
 
 
-def method_sorry(proof_step, selected_objects: [MathObject]) -> CodeForLean:
+def method_sorry(proof_step,
+                 selected_objects: [MathObject],
+                 user_input: [str]) -> CodeForLean:
     """
     Close the current sub-goal by sending the 'sorry' code.
     """
     return CodeForLean.from_string('sorry')
 
 
+# Proof methods, indexed by the number of the choice in action_proof_methods
+PROOF_METHODS = {1: method_cbr,
+                 2: method_contrapose,
+                 3: method_absurdum,
+                 4: method_sorry}
+
+
 # def introduce_new_subgoal(proof_step) -> CodeForLean:
 #     selected_objects = proof_step.selection
 #     user_input = proof_step.user_input
@@ -261,6 +271,18 @@ def introduce_fun(proof_step, selected_objects: [MathObject]) -> CodeForLean:
     raise WrongUserInput(error)
 
 
+@lru_cache(maxsize=1)
+def new_object_choices(language: str) -> tuple:
+    """
+    Return the translated choices of action_new_object, computed once per
+    language.
+    """
+    choices = ((_("Object"), _("Introduce a new object")),
+               (_("Goal"), _("Introduce a new intermediate sub-goal")),
+               (_("Function"), _("Introduce a new function")))
+    return choices
+
+
 @action()
 def action_new_object(proof_step) -> CodeForLean:
     """
@@ -276,12 +298,9 @@ def action_new_object(proof_step) -> CodeForLean:
     codes = CodeForLean()
     # Choose between object/sub-goal/function
     if not user_input:
+        language = cvars.get('i18n.select_language', "en")
         raise MissingParametersError(InputType.Choice,
-                             [(_("Object"), _("Introduce a new object")),
-                              (_("Goal"), _("Introduce a new "
-                                            "intermediate sub-goal")),
-                              (_("Function"), _("Introduce a new "
-                                                "function"))],
+                             list(new_object_choices(language)),
                              title=_("New object"),
                              output=_("Choose what to introduce:"))
     # (1) Choice = new object
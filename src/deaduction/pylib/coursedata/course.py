@@ -31,8 +31,8 @@ This file is part of dEAduction.
     with dEAduction.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from collections import                     OrderedDict
 from dataclasses import                     dataclass
+from functools import                       cached_property
 from pathlib import                         Path
 from typing import                          List, Dict
 import os
@@ -70,13 +70,13 @@ class Course:
     Th attributes are:
     - the content of the corresponding Lean file,
     - the course metadata (e.g. authors, institution, etc.)
-    - the "outline" of the course, an ordered dict describing namespaces
+    - the "outline" of the course, a dict describing namespaces, in file order
     - a list of all statements, Python object containing all information
     related to a Lean statement. This includes the exercises.
     """
     file_content:           str
     metadata:               Dict[str, str]
-    outline:                OrderedDict
+    outline:                Dict[str, str]
     statements:             List[Statement]
     relative_course_path:   Path = None
     # Relative_course_path is added after instantiation.
@@ -126,16 +126,36 @@ class Course:
         for field_name, field_content in self.metadata.items():
             print(f"{field_name}: {field_content}")
 
-    @property
+    @cached_property
     def exercises(self) -> List[Exercise]:
         """
         Extract all the exercises from the statements list.
+        The list is computed once, since statements do not change after
+        the course has been parsed.
         """
         statements = self.statements
         exercises = [item for item in statements
                      if isinstance(item, Exercise)]
         return exercises
 
+    def __getstate__(self):
+        """
+        Do not pickle cached properties, so that pickled courses keep the
+        same content; they are recomputed on first access after loading.
+        """
+        state = self.__dict__.copy()
+        for key in ('exercises', 'file_lines'):
+            state.pop(key, None)
+        return state
+
+    @cached_property
+    def file_lines(self) -> List[str]:
+        """
+        The lines of file_content, split once since file_content does not
+        change after the course has been parsed. Do not modify this list.
+        """
+        return self.file_content.splitlines()
+
     @property
     def initial_proofs_complete(self):
         return None not in [st.initial_proof_state for st in self.statements]
@@ -361,14 +381,13 @@ class Course:
         """
         Return the first Statement whose Lean name ends with name.
         """
-        # Try Lean names
-        statements = [st for st in self.statements if st.has_name(name)]
-        if statements:
-            return statements[0]
-        # Try pretty names
-        statements = [st for st in self.statements if st.has_pretty_name(name)]
-        if statements:
-            return statements[0]
+        # Try Lean names, then pretty names; stop at first match
+        statement = next((st for st in self.statements if st.has_name(name)),
+                         None)
+        if statement is None:
+            statement = next((st for st in self.statements
+                              if st.has_pretty_name(name)), None)
+        return statement
 
     @property
     def ips_path(self):
@@ -458,14 +477,15 @@ exercises_theorie_des_ensembles.lean")
     print("My course:")
     print("List of statements:")
     count_ex = 0
+    statement_types = {Exercise: "Exercise", Definition: "Definition",
+                       Theorem: "Theorem"}
     for statement in my_course.statements:
-        if isinstance(statement, Exercise):
+        statement_type = statement_types.get(type(statement))
+        if statement_type == "Exercise":
             count_ex += 1
             print(f"Exercise n°{count_ex}: {statement.pretty_name}")
-        elif isinstance(statement, Definition):
-            print(f"Definition {statement.pretty_name}")
-        elif isinstance(statement, Theorem):
-            print(f"Theorem {statement.pretty_name}")
+        elif statement_type:
+            print(f"{statement_type} {statement.pretty_name}")
         #for key in statement.__dict__.keys():
         #    print(f"    {key}: {statement.__dict__[key]}")
     print('Sections:')
@@ -346,9 +346,7 @@ class Exercise(Theorem):
 
     @property
     def exercise_number(self) -> int:
-        exercises = [statement for statement in self.course.statements
-                     if isinstance(statement, Exercise)]
-        return exercises.index(self)
+        return self.course.exercises.index(self)
 
     @property
     def definitions(self):
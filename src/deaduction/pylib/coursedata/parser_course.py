@@ -99,16 +99,13 @@ statement_rules = """
 statement = variables spaces ":" core_statement
     variables = variable*
         variable =  paren_expr / accol_expr / bracket_expr
-            paren_expr      =  spaces "(" (any_char_but_p / variable)* ")" 
-            accol_expr      =  spaces "{" (any_char_but_p / variable)* "}"
-            bracket_expr    =  spaces "[" (any_char_but_p / variable)* "]"
-    core_statement = any_char*
+            paren_expr      =  spaces "(" (chars_but_p / variable)* ")" 
+            accol_expr      =  spaces "{" (chars_but_p / variable)* "}"
+            bracket_expr    =  spaces "[" (chars_but_p / variable)* "]"
+    core_statement = ~r"(?s).*"
 
 spaces = (" " / end_of_line)*
-any_char_but_p = (!"(" !")" !"{" !"}" !"[" !"]" any_char_but_eol) / 
-end_of_line 
-any_char = any_char_but_eol / end_of_line
-any_char_but_eol = ~r"."
+chars_but_p = ~r"[^(){}\\[\\]]+"
 end_of_line = "\\n"
 """
 
@@ -176,8 +173,9 @@ course_rules = """course =
 
 something_else_rules = """
 something_else = (line_comment / 
-((non_coding any_char_but_eol)* end_of_line)  )*
+((non_coding_chars / (non_coding any_char_but_eol))* end_of_line)  )*
 non_coding = !namespace_open_or_close !statement !metadata
+non_coding_chars = ~r"[^\\nnel/]+"
 """
 
 namespace_rules = """
@@ -210,7 +208,7 @@ definition_or_theorem = "lemma" space_or_eol+
     theorem_name = "theorem." identifier
     exercise_name = "exercise." identifier
     
-    lean_statement = ((!separator_equal_def any_char_but_eol)* end_of_line*)+
+    lean_statement = (until_separator_equal_def end_of_line*)+
     
     separator_equal_def = ":="
 """
@@ -218,7 +216,7 @@ definition_or_theorem = "lemma" space_or_eol+
 proof_rules = """
 proof = begin_proof core_proof end_proof
     begin_proof = "begin" space_or_eol 
-    core_proof = ((!begin_proof !end_proof any_char_but_eol*) end_of_line)*
+    core_proof = ((!begin_proof !end_proof rest_of_line) end_of_line)*
     end_proof = "end" space_or_eol
 """
 
@@ -229,22 +227,24 @@ metadata =  open_metadata
             
     metadata_field = metadata_field_name  end_of_line  metadata_field_content
         
-        metadata_field_name = (!space !close_metadata any_char_but_eol)+ space*
+        metadata_field_name = ~r"(?:(?!-/)\\S)+" space*
         metadata_field_content = ((space+ metadata_content_line end_of_line) 
                                   /end_of_line)+
-        metadata_content_line = !close_metadata any_char_but_eol*
+        metadata_content_line = !close_metadata rest_of_line
     open_metadata = "/-" space+ "dEAduction" space_or_eol+
     close_metadata = "-/"
 """
 
 interlude_rules = """
-interlude = ((!metadata !"lemma" !"namespace" any_char_but_eol)* 
+interlude = ((interlude_chars /
+               (!metadata !"lemma" !"namespace" any_char_but_eol))* 
                     space_or_eol*)*
+interlude_chars = ~r"[^\\nln/]+"
 """
 # may be empty
 
 line_comment_rules = """
-line_comment = "--" any_char_but_eol* end_of_line
+line_comment = "--" rest_of_line end_of_line
 """
 
 identifier_rules = """
@@ -256,6 +256,8 @@ namespace_identifier = identifier_start (identifier_rest)*
 
 basic_rules = """
 any_char_but_eol = ~r"."
+rest_of_line = ~r".*"
+until_separator_equal_def = ~r"(?:(?!:=).)*"
 letter = ~r"[a-zA-Z]"
 digits = ~r"[0-9']"
 space_or_eol = end_of_line / ~r"\s"
@@ -339,13 +341,13 @@ class LeanCourseVisitor(NodeVisitor):
         course_history, data = get_info(visited_children)
         data.setdefault("metadata", {})
         metadata = data.pop("metadata")
-        if "exercise_name" in data.keys():
+        if "exercise_name" in data:
             event_name = "exercise"
             lean_name = data.pop("exercise_name")
-        elif "definition_name" in data.keys():
+        elif "definition_name" in data:
             event_name = "definition"
             lean_name = data.pop("definition_name")
-        elif "theorem_name" in data.keys():
+        elif "theorem_name" in data:
             event_name = "theorem"
             lean_name = data.pop("theorem_name")
         else:  # This should not happen
@@ -355,7 +357,7 @@ class LeanCourseVisitor(NodeVisitor):
         metadata["lean_variables"] = data.pop("lean_variables")
         metadata["lean_core_statement"] = data.pop("lean_core_statement")
         # Compute automatic pretty_name if not found by parser
-        short_name = lean_name.split(".")[1]
+        short_name = lean_name.partition(".")[2]
         automatic_pretty_name = short_name.replace("_", " ").capitalize()
         metadata.setdefault("pretty_name", automatic_pretty_name)
 
@@ -401,7 +403,7 @@ class LeanCourseVisitor(NodeVisitor):
         # The following collects the metadata in the corresponding field.
         # This is the only info from children, so it is passed as data.
         metadata = {}
-        if "metadata_field_content" in data.keys():
+        if "metadata_field_content" in data:
             field_name = change_name(data["metadata_field_name"])
             # e.g. PrettyName -> pretty_name
             metadata[field_name] = data["metadata_field_content"]
@@ -428,16 +430,16 @@ class LeanCourseVisitor(NodeVisitor):
         :return: course_history and data.
         """
         course_history, data = get_info(visited_children)
-        data["metadata_field_content"] = ""
         # If the metadata content spreads on several lines, then get_info
         # gets only the last line...
+        # Lines are collected and joined once; empty lines before the first
+        # non-empty one are ignored.
+        lines = []
         for _, child_data in visited_children:
-            if 'metadata_content_line' in child_data:
-                more_content = child_data['metadata_content_line']
-                if data["metadata_field_content"]:
-                    data["metadata_field_content"] += " " + more_content
-                else:
-                    data["metadata_field_content"] = more_content
+            more_content = child_data.get('metadata_content_line')
+            if more_content is not None and (lines or more_content):
+                lines.append(more_content)
+        data["metadata_field_content"] = " ".join(lines)
         return course_history, data
 
     def visit_metadata_content_line(self, node, visited_children):
@@ -569,6 +571,9 @@ def get_info(children: List[Tuple[list, dict]]) -> Tuple[list, dict]:
                         child_history is a list, and child_data is a dict.
     :return:            couple (course_history, concatenated_data)
     """
+    if len(children) == 1:
+        # Most nodes have a single child, whose info is not used elsewhere
+        return children[0]
     course_history = []
     data = {}
     for child_history, child_data in children:
@@ -586,9 +591,9 @@ def change_name(name: str) -> str:
     if name.startswith('$'):  # macro: do not touch!!
         return name
 
-    upper_case_alphabet = [chr(i) for i in range(65, 91)]
-    for letter in upper_case_alphabet:
-        name = name.replace(letter, '_' + letter.lower())
+    # Single pass on name, instead of one replace() per letter
+    name = "".join('_' + char.lower() if 'A' <= char <= 'Z' else char
+                   for char in name)
     # Finally remove the leading '_'
     if name.startswith('_'):
         name = name[1:]
@@ -427,8 +427,9 @@ class VirtualFile:
         """
         return the number of the last line of inner content
         """
-        text = self.preamble + self.inner_contents
-        line_number = text.count("\n")
+        # (Count separately to avoid building the whole text)
+        line_number = (self.preamble.count("\n")
+                       + self.inner_contents.count("\n"))
         return line_number
 
     @property
@@ -347,12 +347,13 @@ class LeanServer:
         req.seq_num  = seq_num
 
         jss         = req.to_json()
-        self.log.debug(f"Tx : {jss}")
+        # (Lazy formatting: jss contains the whole file for SyncRequest)
+        self.log.debug("Tx : %s", jss)
 
         try:
             with trio.move_on_after(30):
                 await self.process.stdin.send_all(
-                    (str(jss) + "\n").encode("utf-8")
+                    (jss + "\n").encode("utf-8")
                 )
 
                 await ev.wait()
@@ -33,6 +33,7 @@ This file is part of dEAduction.
 from parsimonious.grammar import Grammar
 from parsimonious.nodes import NodeVisitor
 import logging
+import sys
 
 from deaduction.pylib.mathobj import MathObject, ContextMathObject
 
@@ -143,7 +144,9 @@ class LeanEntryVisitor(NodeVisitor):
         return math_object
 
     def visit_node_name(self, node, visited_children):
-        return [], {'node_name': node.text}
+        # Node names come from a small alphabet: intern them so that all
+        #  MathObjects share the same strings
+        return [], {'node_name': sys.intern(node.text)}
 
     def visit_expr(self, node, visited_children):
         """
@@ -174,6 +177,9 @@ class LeanEntryVisitor(NodeVisitor):
         Return: a dictionary with a single entry
         """
         info_field_name, _, info_field_content = visited_children
+        if info_field_name == 'name':
+            # Names are parsed again at each proof step: share them
+            info_field_content = sys.intern(info_field_content)
         info = {info_field_name: info_field_content}
         return [], info
 
@@ -57,7 +57,7 @@ log = logging.getLogger(__name__)
 global _
 
 
-CONSTANT_IMPLICIT_ARGS = ("real.decidable_linear_order",)
+CONSTANT_IMPLICIT_ARGS = frozenset({"real.decidable_linear_order"})
 
 
 def allow_implicit_use(test: callable) -> callable:
@@ -84,29 +84,27 @@ def allow_implicit_use(test: callable) -> callable:
         else:
             MathObject.last_used_implicit_definition = None
             MathObject.last_rw_object = None
-            if is_math_type:
-                math_type = math_object
-            else:
-                math_type = math_object.math_type
+            math_type = math_object if is_math_type else math_object.math_type
             definition_patterns = MathObject.definition_patterns
-            for index in range(len(definition_patterns)):
+            for index in MathObject.definition_indices(math_type):
                 # Test right term if self match pattern
                 pattern = definition_patterns[index]
                 pattern_left = pattern.children[0]
                 pattern_right = pattern.children[1]
-                log.debug(f"(Trying definition "
-                      f"{MathObject.implicit_definitions[index].pretty_name}"
-                      f"...)")
+                log.debug("(Trying definition %s...)",
+                          MathObject.implicit_definitions[index].pretty_name)
                 if pattern_left.match(math_type):
                     if test(pattern_right, is_math_type=True):
                         definition = MathObject.implicit_definitions[index]
                         MathObject.last_used_implicit_definition = definition
                         rw_math_object = pattern_right.apply_matching()
                         MathObject.last_rw_object = rw_math_object
-                        log.debug(f"Implicit definition: "
-                                  f"{definition.pretty_name}")
-                        log.debug(f"    {math_type.to_display()}  <=>"
-                                  f" {rw_math_object.to_display()}")
+                        log.debug("Implicit definition: %s",
+                                  definition.pretty_name)
+                        # Displaying is costly: do it only when needed
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug(f"    {math_type.to_display()}  <=>"
+                                      f" {rw_math_object.to_display()}")
                         return True
             return False
     return test_implicit
@@ -141,6 +139,7 @@ class MathObject:
     # numbers involved in the current exercise
     bound_var_counter = 0  # A counter to distinguish bound variables
     is_bound_var = False
+    _has_bound_var = None  # Computed once by has_bound_var()
 
     ###########################################
     # Lists from definitions for implicit use #
@@ -150,12 +149,48 @@ class MathObject:
     definitions = []
     implicit_definitions          = []
     definition_patterns           = []
+    # Indices of definition_patterns by node, cf definition_indices():
+    _definition_indices_by_node   = {}
+    _indexed_definition_patterns  = None
+    _indexed_definitions_nb       = 0
     # The following class attributes are modified each time an implicit
     # definition is used with success:
     last_used_implicit_definition = None
     last_rw_object                = None
 
-    INEQUALITIES = ("PROP_<", "PROP_>", "PROP_≤", "PROP_≥", "PROP_EQUAL_NOT")
+    INEQUALITIES = frozenset({"PROP_<", "PROP_>", "PROP_≤", "PROP_≥",
+                              "PROP_EQUAL_NOT"})
+    # Nodes of negation bodies that may be simplified, i.e. negations,
+    # quantifiers, and, or, implications and inequalities,
+    # cf is_simplifiable_body_of_neg()
+    SIMPLIFIABLE_NODES_OF_NEG = frozenset({"PROP_NOT", "PROP_NOT_BELONGS",
+                                           "QUANT_∀", "QUANT_∃", "QUANT_∃!",
+                                           "PROP_AND", "PROP_∃", "PROP_OR",
+                                           "PROP_IMPLIES"}) | INEQUALITIES
+    # Node of the body of negations with special nodes,
+    # cf body_of_negation()
+    NODES_OF_NEGATED_BODIES = {"PROP_NOT_BELONGS": "PROP_BELONGS",
+                               "PROP_EQUAL_NOT": "PROP_EQUAL"}
+    # Indexed by 2 * contain_left + contain_right,
+    # cf direction_for_substitution_in()
+    SUBSTITUTION_DIRECTIONS = ('', '>', '>', 'both')
+    # Main symbol of each node, cf main_symbol()
+    MAIN_SYMBOLS = {"PROP_AND": "and",
+                    "PROP_∃": "and",
+                    "PROP_OR": "or",
+                    "PROP_NOT": "not",
+                    "PROP_NOT_BELONGS": "not",
+                    "PROP_EQUAL_NOT": "not",
+                    "PROP_IMPLIES": "implies",
+                    "PROP_IFF": "iff",
+                    "QUANT_∀": "forall",
+                    "QUANT_∃": "exists",
+                    "QUANT_∃!": "exists",
+                    "PROP_EQUAL": "equal",
+                    "FUNCTION": "function"}
+    # Nodes that may have a bound var, cf has_bound_var()
+    BOUND_VAR_NODES = frozenset({"QUANT_∀", "QUANT_∃", "QUANT_∃!",
+                                 "SET_INTENSION", "LAMBDA", "LOCAL_CONSTANT"})
 
 #######################
 # Fundamental methods #
@@ -244,6 +279,7 @@ class MathObject:
                 # We add 3 children for compatibility
                 self.children = [bound_var_type, bound_var,
                                  MathObject.PROP]
+                self._has_bound_var = None  # Children have changed
 
         # (2) Replace child sequence by a lambda
         if self.node not in ('APPLICATION', 'LAMBDA'):
@@ -262,6 +298,35 @@ class MathObject:
                     # Replace child by lambda with the same math_type
                     self.children[index] = lam
 
+    @classmethod
+    def definition_indices(cls, math_object):
+        """
+        Return the indices of the patterns of definition_patterns whose left
+        term may match math_object, in their original order. Patterns are
+        sorted out by root node only once for each node, so that
+        pattern.match() is not tried on patterns that cannot match.
+        The index is rebuilt if definition_patterns has changed.
+        """
+        definition_patterns = MathObject.definition_patterns
+        if math_object.is_no_math_type():  # This may match anything
+            return range(len(definition_patterns))
+
+        if (MathObject._indexed_definition_patterns is not definition_patterns
+                or MathObject._indexed_definitions_nb
+                != len(definition_patterns)):
+            MathObject._definition_indices_by_node = {}
+            MathObject._indexed_definition_patterns = definition_patterns
+            MathObject._indexed_definitions_nb = len(definition_patterns)
+
+        node = math_object.node
+        indices = MathObject._definition_indices_by_node.get(node)
+        if indices is None:
+            indices = tuple(index for index, pattern
+                            in enumerate(definition_patterns)
+                            if pattern.children[0].may_match_node(node))
+            MathObject._definition_indices_by_node[node] = indices
+        return indices
+
     @classmethod
     def FALSE(cls):
         """
@@ -276,19 +341,12 @@ class MathObject:
         :param name: an element of NUMBER_SETS_LIST = ['ℕ', 'ℤ', 'ℚ', 'ℝ']
         """
         if name in cls.NUMBER_SETS_LIST and name not in cls.number_sets:
-            cls.number_sets.append(name)
-            counter = len(MathObject.number_sets) - 1
-            while counter > 0:
-                old_item = cls.number_sets[counter - 1]
-                if cls.NUMBER_SETS_LIST.index(name) < \
-                   cls.NUMBER_SETS_LIST.index(old_item):
-                    # Swap
-                    cls.number_sets[counter] = old_item
-                    cls.number_sets[counter-1] = name
-                    counter -= 1
-                else:
-                    break
-            log.debug(f"Number_sets: {MathObject.number_sets}")
+            # Rebuild the list in place, in the order of NUMBER_SETS_LIST
+            cls.number_sets[:] = [number_set for number_set
+                                  in cls.NUMBER_SETS_LIST
+                                  if number_set == name
+                                  or number_set in cls.number_sets]
+            log.debug("Number_sets: %s", MathObject.number_sets)
 
     @classmethod
     def from_info_and_children(cls, info: {}, children: []):
@@ -303,17 +361,13 @@ class MathObject:
 
         # (0) Name and math_type
         node = info.pop("node_name")
-        if 'math_type' in info.keys():
-            math_type = info.get('math_type')
-        else:
-            math_type = None  # NB math_type is a @property, cf above
+        math_type = info.get('math_type')  # NB math_type is a @property
 
         # (1) Treatment of constants
         if node == 'CONSTANT':
             name = info.get('name')
-            if name and name in MathObject.constants:
-                math_object = MathObject.constants[name]
-            else:
+            math_object = MathObject.constants.get(name) if name else None
+            if math_object is None:
                 math_object = cls(node=node,
                                   info=info,
                                   math_type=math_type,
@@ -322,18 +376,15 @@ class MathObject:
 
         # (2) Treatment of global variables: avoiding duplicate
         # This concerns only MathObjects with node=='LOCAL_CONSTANT'
-        elif 'identifier' in info.keys():
+        elif 'identifier' in info:
             identifier = info['identifier']
-            if identifier in MathObject.Variables:
-                # (1.a) Return already existing MathObject
-                math_object = MathObject.Variables[identifier]
-            else:
+            # (1.a) Return already existing MathObject, if any
+            math_object = MathObject.Variables.get(identifier)
+            if math_object is None:
                 # (1.b) Create new object
                 # (i) BoundVar case
                 name = info.get('name')
                 if name and name.endswith('.BoundVar'):
-                    if name == 'u.BoundVar':
-                        print("debug")
                     # Remove suffix and create a BoundVar
                     info['name'] = info['name'][:-len('.BoundVar')]
                     math_object = BoundVar(node=node,
@@ -425,17 +476,20 @@ class MathObject:
         - set families, e.g. {E_i, i in I}.
         for which the bound var is used only to display a context object
         (in propositions they are replaced by lambda expressions).
-        """
-        nodes = ("QUANT_∀", "QUANT_∃", "QUANT_∃!", "SET_INTENSION", "LAMBDA",
-                 "LOCAL_CONSTANT")
 
-        if self.node in nodes:
-            return len(self.children) == 3 and self.children[1].is_bound_var
-        # elif self.is_variable(is_math_type=True) and \
-        #         (self.is_sequence() or self.is_set_family()):
-        #     return len(self.children) == 3 and self.children[1].is_bound_var
-
-        return False
+        The result is computed only once, since children are not modified
+        (except by process_sequences_and_likes(), which resets it).
+        """
+        has_bound_var = self._has_bound_var
+        if has_bound_var is None:
+            has_bound_var = (self.node in self.BOUND_VAR_NODES
+                             and len(self.children) == 3
+                             and self.children[1].is_bound_var)
+            # elif self.is_variable(is_math_type=True) and \
+            #         (self.is_sequence() or self.is_set_family()):
+            #     return len(self.children) == 3 and self.children[1].is_bound_var
+            self._has_bound_var = has_bound_var
+        return has_bound_var
 
     @property
     def bound_var_type(self):
@@ -462,19 +516,19 @@ class MathObject:
         """
 
         # (1) Self's has direct bound var?
-        self_vars = []
+        bound_vars = []
         if self.has_bound_var():
             # if include_sequences or \
             #         not (self.is_sequence(is_math_type=True)
             #              or self.is_set_family(is_math_type=True)):
             if (not math_type) or self.bound_var_type == math_type:
-                self_vars = [self.bound_var]
+                bound_vars.append(self.bound_var)
 
         # (2) children's vars:
-        child_vars = sum([child.bound_vars(math_type=math_type)
-                          for child in self.children], [])
+        for child in self.children:
+            bound_vars.extend(child.bound_vars(math_type=math_type))
 
-        return self_vars + child_vars
+        return bound_vars
 
     def set_local_context(self, local_context=None):
         """
@@ -489,25 +543,28 @@ class MathObject:
         #  put in its local context.
         local_is_local = not cvars.get(
             'logic.do_not_name_dummy_vars_as_dummy_vars_in_one_prop', False)
+        # If local_is_local, loc ctxts of children are independent: we use
+        #  tuples, that are never modified and thus need not be copied.
+        #  If not, the list is shared (and enriched) along the whole tree.
         if local_context is None:
-            local_context = []
+            local_context = () if local_is_local else []
 
         # Set local context for bound vars, and add them to local context.
         for child in self.children:
             if child.is_bound_var:
-                # Copy so that child's loca ctxt will not be affected
-                #  by future changes
-                child.local_context = copy(local_context)
-                local_context.append(child)
+                if local_is_local:
+                    child.local_context = local_context
+                    local_context += (child,)
+                else:
+                    # Copy so that child's loca ctxt will not be affected
+                    #  by future changes
+                    child.local_context = copy(local_context)
+                    local_context.append(child)
 
         # Propagate (enriched) local context to other children
-        for child in self.children:
-            if not self.is_bound_var:
-                # If local_is_local, loc ctxts of children are independent
-                new_local_context = (copy(local_context) if local_is_local
-                                     else local_context)
-
-                child.set_local_context(new_local_context)
+        if not self.is_bound_var:
+            for child in self.children:
+                child.set_local_context(local_context)
 
     # def is_unnamed(self):
     #     return self.display_name == "NO NAME" \
@@ -629,8 +686,10 @@ class MathObject:
         Return the MathObject corresponding to the line_of_descent
         e.g. self.descendant((1.0))  -> children[1].children[0]
 
-        :param line_of_descent:     int or tuple or list
-        :return:                    MathObject
+        :param line_of_descent:     int or non-empty tuple or list
+        :return:                    MathObject, or None if some child number
+                                    is out of range
+        Raise ValueError if line_of_descent is empty.
         """
         if type(line_of_descent) == int:
             # if self.is_application():
@@ -638,14 +697,14 @@ class MathObject:
             # else:
             return self.children[line_of_descent]
 
-        child_number, *remaining = line_of_descent
-        if child_number >= len(self.children):
-            return None
-        child = self.children[child_number]
-        if not remaining:
-            return child
-        else:
-            return child.descendant(remaining)
+        if not line_of_descent:
+            raise ValueError("Empty line of descent")
+        descendant = self
+        for child_number in line_of_descent:
+            if child_number >= len(descendant.children):
+                return None
+            descendant = descendant.children[child_number]
+        return descendant
 
     def give_name(self, name):
         self.info["name"] = name
@@ -737,6 +796,7 @@ class MathObject:
                     #     log.debug(f"and {child1}")
                     #     log.debug(f" in {self}")
                     equal = False
+                    break  # No need to compare remaining children
 
             # Un-mark bound_vars
             if bound_var_1:
@@ -749,19 +809,36 @@ class MathObject:
         """
         Compute the number of copies of other contained in self.
         """
-
-        if self is self.NO_MATH_TYPE:  # NO_MATH_TYPE is equal to anything...
-            return 0
-
-        if MathObject.__eq__(self, other):
-            return 1
-        else:
-            for child in self.children:
-                test = child.contains(other)
-                if test:
-                    print("debug")
-
-            return sum([child.contains(other) for child in self.children])
+        counter = 0
+        math_objects = [self]
+        while math_objects:
+            math_object = math_objects.pop()
+            # NO_MATH_TYPE is equal to anything...
+            if math_object is self.NO_MATH_TYPE:
+                continue
+            if MathObject.__eq__(math_object, other):
+                counter += 1
+            else:
+                math_objects.extend(math_object.children)
+        return counter
+
+    def contains_both(self, term0, term1) -> bool:
+        """
+        Test if self contains both term0 and term1, walking through self
+        only once, and stopping as soon as both terms have been found.
+        """
+        found0, found1 = False, False
+        math_objects = [self]
+        while math_objects:
+            math_object = math_objects.pop()
+            if math_object is self.NO_MATH_TYPE:
+                continue
+            found0 = found0 or MathObject.__eq__(math_object, term0)
+            found1 = found1 or MathObject.__eq__(math_object, term1)
+            if found0 and found1:
+                return True
+            math_objects.extend(math_object.children)
+        return False
 
     def direction_for_substitution_in(self, other) -> str:
         """
@@ -785,14 +862,10 @@ class MathObject:
         if equality.node not in ['PROP_EQUAL', 'PROP_IFF']:
             return ''
         left, right = equality.children
-        contain_left = other.contains(left)
-        contain_right = other.contains(right)
-        decision = {(False, False): '',
-                    (True, False): '>',
-                    (False, True): '>',
-                    (True, True): 'both'
-                    }
-        return decision[contain_left, contain_right]
+        # NB: contains() returns a number of occurrences
+        contain_left = bool(other.contains(left))
+        contain_right = bool(other.contains(right))
+        return self.SUBSTITUTION_DIRECTIONS[2 * contain_left + contain_right]
 
 #######################
 # Tests for math_type #
@@ -807,20 +880,14 @@ class MathObject:
         but NOT self.is_prop()
         (so if self is H, then self.math_type.math_type.is_prop() is True).
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         return math_type.node == "PROP"
 
     def is_type(self, is_math_type=False) -> bool:
         """
         Test if (math_type of) self is a "universe".
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         return math_type.node == "TYPE"
 
     def is_variable(self, is_math_type=False) -> bool:
@@ -830,27 +897,20 @@ class MathObject:
         - to be a local constant,
         - not a property nor a type
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
 
-        if math_type.node == "LOCAL_CONSTANT":
-            math_type_of_math_type = math_type.math_type
-            if not (math_type_of_math_type.is_prop(is_math_type=False) or
-                    math_type_of_math_type.is_type(is_math_type=True) or
-                    math_type_of_math_type.is_no_math_type()):
-                return True
-        return False
+        if math_type.node != "LOCAL_CONSTANT":
+            return False
+        math_type_of_math_type = math_type.math_type
+        return not (math_type_of_math_type.math_type.node == "PROP"
+                    or math_type_of_math_type.node == "TYPE"
+                    or math_type_of_math_type.is_no_math_type())
 
     def is_sequence(self, is_math_type=False) -> bool:
         """
         Test if (math_type of) self is "SEQUENCE".
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         return math_type.node == "SEQUENCE"
 
     def is_app_of_local_constant(self) -> bool:
@@ -869,50 +929,35 @@ class MathObject:
         """
         Test if (math_type of) self is "SET_FAMILY".
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         return math_type.node == "SET_FAMILY"
 
     def is_lambda(self, is_math_type=False) -> bool:
         """
         Test if (math_type of) self is "LAMBDA".
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         return math_type.node == "LAMBDA"
 
     def is_nat(self, is_math_type=False) -> bool:
         """
         Test if (math_type of) self is ℕ.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         return math_type.node == "CONSTANT" and math_type.info['name'] == "ℕ"
 
     def is_function(self, is_math_type=False) -> bool:
         """
         Test if (math_type of) self is a function.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         return math_type.node == "FUNCTION"
 
     def is_atomic_belong(self, is_math_type=False) -> bool:
         """
         Test if (math_type of) self is a function.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         test = (math_type.node == "PROP_BELONGS" and
                 math_type.children[1].node == "LOCAL_CONSTANT")
         return test
@@ -922,10 +967,7 @@ class MathObject:
         """
         Test if (math_type of) self is a conjunction.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         return (math_type.node == "PROP_AND"
                 or math_type.node == "PROP_∃")
 
@@ -934,10 +976,7 @@ class MathObject:
         """
         Test if (math_type of) self is a disjunction.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         return math_type.node == "PROP_OR"
 
     @allow_implicit_use
@@ -945,23 +984,17 @@ class MathObject:
         """
         Test if (math_type of) self is an implication.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         return math_type.node == "PROP_IMPLIES"
 
     def premise(self, is_math_type=False) -> bool:
         """
         If self is an implication, return its premise.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
 
-        premise = math_type.children[0] if self.is_implication(is_math_type) \
-            else None
+        premise = (math_type.children[0]
+                   if math_type.node == "PROP_IMPLIES" else None)
         return premise
 
     @allow_implicit_use
@@ -969,10 +1002,7 @@ class MathObject:
         """
         Test if (math_type of) self is an existence property.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         return math_type.node in ("QUANT_∃", "QUANT_∃!")
 
     @allow_implicit_use
@@ -980,10 +1010,7 @@ class MathObject:
         """
         Test if (math_type of) self is a universal property.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         return math_type.node == "QUANT_∀"
 
     def implicit(self, test: callable):
@@ -1007,12 +1034,9 @@ class MathObject:
         """
         Test if (math_type of) self is a quantified property.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
-        return (math_type.is_exists(is_math_type=True)
-                or math_type.is_for_all(is_math_type=True))
+        math_type = self if is_math_type else self.math_type
+        # Explicit test only, no need to go through allow_implicit_use
+        return math_type.node in ("QUANT_∀", "QUANT_∃", "QUANT_∃!")
 
     def is_equality(self, is_math_type=False) -> bool:
         """
@@ -1039,20 +1063,14 @@ class MathObject:
         """
         Test if (math_type of) self is an equality.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         return math_type.node == "PROP_EQUAL_NOT"
 
     def is_inequality(self, is_math_type=False) -> bool:
         """
         Test if (math_type of) self is an inequality.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         return math_type.node in self.INEQUALITIES
 
     def is_instance(self) -> bool:
@@ -1072,12 +1090,10 @@ class MathObject:
         True iff self is an equality or an inequality between numbers,
         i.e. elements of the MathObject.NUMBER_SETS_LIST.
         """
-        if (self.is_equality(is_math_type=True)
-            or self.is_inequality(is_math_type=True)
-                or self.is_non_equality(is_math_type=True)):
+        # NB: INEQUALITIES include PROP_EQUAL_NOT
+        if self.node == "PROP_EQUAL" or self.node in self.INEQUALITIES:
             name = self.children[0].math_type.display_name
-            if name in self.NUMBER_SETS_LIST:
-                return True
+            return name in self.NUMBER_SETS_LIST
         return False
 
     # Numbers : ['ℕ', 'ℤ', 'ℚ', 'ℝ']
@@ -1091,20 +1107,17 @@ class MathObject:
         return self.display_name == 'ℚ'
 
     def is_R(self):
-        return (self.display_name == 'ℝ'
-                or self.display_name == 'RealSubGroup')
+        return self.display_name in ('ℝ', 'RealSubGroup')
 
     def is_number(self):
-        return any([self.is_N(), self.is_Z(), self.is_Q(), self.is_R()])
+        # Same as is_N() or is_Z() or is_Q() or is_R(), reading name once
+        return self.display_name in ('ℕ', 'ℤ', 'ℚ', 'ℝ', 'RealSubGroup')
 
     def is_iff(self, is_math_type=False) -> bool:
         """
         Test if (math_type of) self is 'PROP_IFF'.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
 
         return math_type.node == "PROP_IFF"
 
@@ -1113,10 +1126,7 @@ class MathObject:
         """
         Test if (math_type of) self is a negation.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
 
         return math_type.node in ("PROP_NOT", "PROP_NOT_BELONGS",
                                   "PROP_EQUAL_NOT")
@@ -1127,10 +1137,10 @@ class MathObject:
         belong, not equal.
         """
         body = None
+        not_not_node = self.NODES_OF_NEGATED_BODIES.get(self.node)
         if self.node == "PROP_NOT":
             body = self.children[0]
-        elif self.node in ("PROP_NOT_BELONGS", "PROP_EQUAL_NOT"):
-            not_not_node = self.node.replace("_NOT", "")
+        elif not_not_node:
             body = MathObject(node=not_not_node,
                               info=self.info,
                               children=self.children,
@@ -1142,14 +1152,8 @@ class MathObject:
         """
         Return True if not (self) may be directly simplified.
         """
-        tests = [self.is_not(is_math_type=is_math_type),
-                 self.is_for_all(is_math_type=is_math_type),
-                 self.is_exists(is_math_type=is_math_type),
-                 self.is_and(is_math_type=is_math_type),
-                 self.is_or(is_math_type=is_math_type),
-                 self.is_implication(is_math_type=is_math_type),
-                 self.is_inequality(is_math_type=is_math_type)]
-        return any(tests)
+        math_type = self if is_math_type else self.math_type
+        return math_type.node in self.SIMPLIFIABLE_NODES_OF_NEG
 
     def first_pushable_body_of_neg(self, is_math_type=False):
         """
@@ -1163,14 +1167,14 @@ class MathObject:
         the part not (Q => R) will be detected. Note that push_neg_once
         will work in that case.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
 
         # (1) Self is a negation
-        if math_type.is_not(is_math_type=True):
-            body = math_type.body_of_negation()
+        #  NB: the bodies of "not belong" and "not equal", i.e. belong and
+        #  equal, are never simplifiable, so there is no need to build them
+        #  with body_of_negation().
+        if math_type.node == "PROP_NOT":
+            body = math_type.children[0]
             if body.is_simplifiable_body_of_neg(is_math_type=True):
                 return body
             else:  # This part allow to explore tree under unpushable negation:
@@ -1188,10 +1192,7 @@ class MathObject:
         """
         Test if (math_type of) self is 'contradiction'.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
         if math_type.node == "PROP_FALSE":
             return True
         else:
@@ -1215,15 +1216,12 @@ class MathObject:
         """
         Return 'ℕ', 'ℤ', 'ℚ', 'ℝ' if self is a number, else None
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
-        name = math_type.display_name
-        if math_type.node == 'CONSTANT' and name in ['ℕ', 'ℤ', 'ℚ', 'ℝ']:
-            return name
-        else:
-            return None
+        math_type = self if is_math_type else self.math_type
+        if math_type.node == 'CONSTANT':
+            name = math_type.display_name
+            if name in self.NUMBER_SETS_LIST:
+                return name
+        return None
 
     # Determine some important classes of MathObjects
     def can_be_used_for_substitution(self, is_math_type=False) -> (bool,
@@ -1236,7 +1234,7 @@ class MathObject:
             (∀ ...)*  P <=> Q
          with zero or more universal quantifiers at the beginning.
 
-        This is a recursive function: in case self is a universal quantifier,
+        In case self is a universal quantifier,
         self can_be_used_for_substitution iff the body of self
         can_be_used_for_substitution.
 
@@ -1244,18 +1242,12 @@ class MathObject:
             - the result of the test (a boolean)
             - the equality or iff, so that the two terms may be retrieved
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
-        if math_type.is_equality(is_math_type=True) \
-                or math_type.is_iff(is_math_type=True):
-            return True, math_type
-        elif math_type.is_for_all(is_math_type=True):
+        math_type = self if is_math_type else self.math_type
+        while math_type.node == "QUANT_∀":
             # NB : ∀ var : type, body
-            body = math_type.children[2]
-            # Recursive call
-            return body.can_be_used_for_substitution(is_math_type=True)
+            math_type = math_type.children[2]
+        if math_type.node in ("PROP_EQUAL", "PROP_IFF"):
+            return True, math_type
         else:
             return False, None
 
@@ -1266,22 +1258,12 @@ class MathObject:
         i.e. is of the form
             (∀ ...)*  P => Q
          with zero or more universal quantifiers at the beginning.
-
-        This is a recursive function.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
-        if math_type.is_implication(is_math_type=True):
-            return True
-        elif math_type.is_for_all(is_math_type=True):
+        math_type = self if is_math_type else self.math_type
+        while math_type.node == "QUANT_∀":
             # NB : ∀ var : type, body
-            body = math_type.children[2]
-            # Recursive call
-            return body.can_be_used_for_implication(is_math_type=True)
-        else:
-            return False
+            math_type = math_type.children[2]
+        return math_type.node == "PROP_IMPLIES"
 
     def is_belongs_or_included(self, is_math_type=False):
         """
@@ -1289,10 +1271,7 @@ class MathObject:
         - "x belongs to A": then return A;
         - "A subset B": then return P(B)
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
 
         if math_type.node == "PROP_BELONGS":
             return math_type.children[1]
@@ -1310,14 +1289,12 @@ class MathObject:
         If this is so, return P(x).
         """
 
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
 
-        if math_type.is_for_all(is_math_type=True):
-            if math_type.children[2].is_implication(is_math_type=True):
-                premise = math_type.children[2].children[0]
+        if math_type.node == "QUANT_∀":
+            body = math_type.children[2]
+            if body.node == "PROP_IMPLIES":
+                premise = body.children[0]
                 return premise
 
         return False
@@ -1327,16 +1304,11 @@ class MathObject:
         If self is a universal property with bounded quantification, try to
         return the real type of the bounded variable.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
 
         premise = math_type.bounded_quantification(is_math_type=True)
         if premise:
-            type_ = premise.is_belongs_or_included(is_math_type=True)
-            if type_:
-                return type_
+            return premise.is_belongs_or_included(is_math_type=True)
 
         return False
 
@@ -1346,25 +1318,11 @@ class MathObject:
         then return "forall".
         """
 
-        if self.is_and(is_math_type=is_math_type):
-            return "and"
-        elif self.is_or(is_math_type=is_math_type):
-            return "or"
-        elif self.is_not(is_math_type=is_math_type):
-            return "not"
-        elif self.is_implication(is_math_type=is_math_type):
-            return "implies"
-        elif self.is_iff(is_math_type=is_math_type):
-            return "iff"
-        elif self.is_for_all(is_math_type=is_math_type):
-            return "forall"
-        elif self.is_exists(is_math_type=is_math_type):
-            return "exists"
-        elif self.is_equality(is_math_type=is_math_type):
-            return "equal"
-        elif self.is_function(is_math_type=is_math_type):
-            return "function"
-        elif self.is_atomic_belong(is_math_type=is_math_type):
+        math_type = self if is_math_type else self.math_type
+        symbol = self.MAIN_SYMBOLS.get(math_type.node)
+        if symbol:
+            return symbol
+        elif math_type.is_atomic_belong(is_math_type=True):
             return "belong"
         else:
             return None
@@ -1381,7 +1339,7 @@ class MathObject:
 
         definition_patterns = MathObject.definition_patterns
         rw_math_objects = []
-        for index in range(len(definition_patterns)):
+        for index in MathObject.definition_indices(self):
             # Test right term if self match pattern
             pattern = definition_patterns[index]
             pattern_left = pattern.children[0]
@@ -1399,7 +1357,7 @@ class MathObject:
     def unfold_implicit_definition_recursively(self):
         """
         Unfold implicit definition recursively, keeping only the first match at
-        each unfolding.
+        each unfolding. Subtrees where no definition applies are not copied.
         """
         # (1) Unfold definitions at top level
         math_object = self
@@ -1409,9 +1367,15 @@ class MathObject:
 
         # (2) Unfold definitions recursively for children
         rw_children = []
+        children_changed = False
         for child in math_object.children:
             rw_child = child.unfold_implicit_definition_recursively()
             rw_children.append(rw_child)
+            if rw_child is not child:
+                children_changed = True
+
+        if not children_changed:
+            return math_object
 
         # (3) Create new object with all defs unfolded
         rw_math_object = MathObject(node=math_object.node,
@@ -1425,10 +1389,7 @@ class MathObject:
         Return the definitions that match self. This is used for the
         ContextMathObject.help_definition() method.
         """
-        if is_math_type:
-            math_type = self
-        else:
-            math_type = self.math_type
+        math_type = self if is_math_type else self.math_type
 
         # if self.node == 'PROP_BELONGS' and self.children[1].node == \
         #         'SET_INTER+':
@@ -1496,11 +1457,13 @@ class MathObject:
                 var = child_vars.pop()
                 more_vars.append(var)
                 # Search for vars of same type in other children vars:
+                var_type = var.math_type
                 for other_child_vars in children_vars[1:]:
-                    types = [v.math_type for v in other_child_vars]
-                    if var.math_type in types:
-                        index = types.index(var.math_type)
-                        other_child_vars.pop(index)
+                    for index, other_var in enumerate(other_child_vars):
+                        other_type = other_var.math_type
+                        if other_type is var_type or other_type == var_type:
+                            other_child_vars.pop(index)
+                            break
 
         vars.extend(more_vars)
         return vars
@@ -1838,8 +1801,9 @@ class BoundVar(MathObject):
             return True
 
         elif isinstance(other, BoundVar):
-            if self.bound_var_nb() != -1:
-                return self.bound_var_nb() == other.bound_var_nb()
+            bound_var_nb = self.bound_var_nb()
+            if bound_var_nb != -1:
+                return bound_var_nb == other.bound_var_nb()
             else:
                 return self.name == other.name  # Is this too easy??
         else:
@@ -1909,10 +1873,11 @@ class BoundVar(MathObject):
         lean_name = self.info.get('lean_name', '')
         if lean_name in ("NO NAME", '*no_name*'):
             lean_name = ''
+        math_type = self.math_type
         letter = (lean_name[:-2] if lean_name.endswith('__')
-                  else lean_name if (lean_name and self.math_type.is_number())
-                  else 'n' if self.math_type.is_N()
-                  else 'x' if self.math_type.is_R()
+                  else lean_name if (lean_name and math_type.is_number())
+                  else 'n' if math_type.is_N()
+                  else 'x' if math_type.is_R()
                   else '')
         sub = letter.find('_')
         if sub > 0:
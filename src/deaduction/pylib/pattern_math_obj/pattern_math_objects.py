@@ -244,6 +244,15 @@ class PatternMathObject(MathObject):
     def is_metavar(self):
         return isinstance(self, MetaVar)
 
+    def may_match_node(self, node: str) -> bool:
+        """
+        Quick test on the root node only: return False if no math_object
+        with this node can match self, cf recursive_match().
+        """
+        return (self.is_no_math_type() or self.is_metavar()
+                or self.node == node
+                or node in metanodes.get(self.node, ()))
+
     def match(self, math_object: MathObject) -> bool:
         """
         Test if math_object match self. This is a recursive test.
@@ -106,19 +106,16 @@ class Goal:
         log.info("creating new Goal from lean strings")
         # log.debug(hypo_analysis)
         # log.debug(target_analysis)
-        lines = hypo_analysis.split("¿¿¿")
-        # Put back "¿¿¿" and remove '\n', getting rid of the title line
-        # ("context:")
-        lines = ['¿¿¿' + item.replace('\n', '') for item in lines[1:]]
+        items = hypo_analysis.split("¿¿¿")
+        del items[0]  # Get rid of the title line ("context:")
         context: [ContextMathObject] = []
-        for math_obj_string in lines:
-            if math_obj_string.startswith("context:"):
-                continue
-            else:
-                # Applying the parser
-                tree = lean_expr_with_type_grammar.parse(math_obj_string)
-                math_object: ContextMathObject = LeanEntryVisitor().visit(tree)
-                context.append(math_object)
+        for item in items:
+            # Put back "¿¿¿" and remove '\n'
+            math_obj_string = '¿¿¿' + item.replace('\n', '')
+            # Applying the parser
+            tree = lean_expr_with_type_grammar.parse(math_obj_string)
+            math_object: ContextMathObject = LeanEntryVisitor().visit(tree)
+            context.append(math_object)
 
         tree = lean_expr_with_type_grammar.parse(target_analysis)
         target = LeanEntryVisitor().visit(tree)
@@ -152,16 +149,18 @@ class Goal:
         Note that instance witnesses are excluded
         (i.e. variables whose name starts with "_inst_" )
         """
-        if self.context is None:
+        context = self.context  # NB: this is computed at each call
+        if context is None:
             return
-        objects = [cmo for cmo in self.context if not cmo.math_type.is_prop()
+        objects = [cmo for cmo in context if not cmo.math_type.is_prop()
                    and not cmo.is_instance()]
         return objects
 
     @property
     def context_props(self) -> [ContextMathObject]:
-        if self.context is not None:
-            props = [cmo for cmo in self.context if cmo.math_type.is_prop()]
+        context = self.context
+        if context is not None:
+            props = [cmo for cmo in context if cmo.math_type.is_prop()]
             return props
 
     @property
@@ -170,8 +169,9 @@ class Goal:
         Return objects and props of the context that are new, i.e. they have
         no parent.
         """
-        if self.context is not None:
-            return [cmo for cmo in self.context if cmo.is_new]
+        context = self.context
+        if context is not None:
+            return [cmo for cmo in context if cmo.is_new]
 
     @property
     def modified_context(self):
@@ -179,8 +179,9 @@ class Goal:
         Return objects and props of the context that are new, i.e. they have
         no parent.
         """
-        if self.context is not None:
-            return [cmo for cmo in self.context if cmo.is_modified]
+        context = self.context
+        if context is not None:
+            return [cmo for cmo in context if cmo.is_modified]
 
     def remove_future_info(self):
         for obj in self.context:
@@ -218,8 +219,7 @@ class Goal:
 
         unused_prop = context_used_prop + str_used_prop
         if unused_prop:
-            log.debug(f"Used properties not found in goal: "
-                        f"{unused_prop}")
+            log.debug("Used properties not found in goal: %s", unused_prop)
 
 ##################
 # Compare method #
@@ -251,8 +251,9 @@ class Goal:
 
         old_goal: Goal
         new_goal = self
-        new_context = new_goal.context.copy()
-        old_context = old_goal.context.copy()
+        # NB: the context property already returns new lists
+        new_context = new_goal.context
+        old_context = old_goal.context
         # Permuted_new_context will contain the new_context in the order
         # reflecting that of the old_context
         # Each new item that is found in the old_context will be affected at
@@ -264,20 +265,25 @@ class Goal:
         log.info("Comparing and tagging old goal and new goal")
         # log.debug(old_context)
         # log.debug(new_context)
-        old_names = [math_object_old.info["name"]
-                     for math_object_old in old_context]
+        # Indices of old objects by name, in context order
+        #  (several objects may share the same name)
+        old_indices = {}
+        for index, math_object_old in enumerate(old_context):
+            old_indices.setdefault(math_object_old.info["name"],
+                                   []).append(index)
         for math_object in new_context:
             name = math_object.info["name"]
 
             # (1) Search old_context for an object with the same name
-            try:
-                old_index = old_names.index(name)
-            except ValueError:
+            indices = old_indices.get(name)
+            if not indices:
                 # (2) If no such object then object is new
-                old_index = None
                 # New objects at the end
                 permuted_new_context.append(math_object)
             else:
+                # First old object with this name that has not been
+                #  considered yet
+                old_index = indices.pop(0)
                 # Put new object at old index, copy tags for ui,
                 #  and link to parent object
                 old_object = old_context[old_index]
@@ -289,11 +295,6 @@ class Goal:
                 if old_object.math_type != math_object.math_type:
                     math_object.is_hidden = False
 
-            if old_index is not None:
-                # Will not be considered anymore:
-                old_names[old_index]   = None
-                old_context[old_index] = None
-
         # (5) Remove 'None' entries
         clean_permuted_new_context = [item for item in permuted_new_context
                                       if item is not None]
@@ -514,8 +515,8 @@ class Goal:
         length = max(local_context_length + [0])
 
         if length > 0:
-            log.debug(f"Bound vars length of {hint.math_type, hint.letter}:"
-                      f" {length}")
+            log.debug("Bound vars length of %s: %s",
+                      (hint.math_type, hint.letter), length)
 
         return length
 
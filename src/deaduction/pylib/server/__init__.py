@@ -618,8 +618,10 @@ class ServerInterface(QObject):
             self.log.debug(_("Proof State received"))
 
             # (Timeout added by FLR) TODO: move this at the end
-            with trio.move_on_after(1):
-                await self.lean_server.running_monitor.wait_ready()
+            # (No need to wait if Lean has already reported it is ready)
+            if self.is_running:
+                with trio.move_on_after(1):
+                    await self.lean_server.running_monitor.wait_ready()
 
             self.log.debug(_("After request"))
 
@@ -629,12 +631,10 @@ class ServerInterface(QObject):
         else:
             self.log.warning(f"Unexpected Lean response: {resp.message}")
         # Emit exceptions ?
-        error_list = []
-        try:
-            while True:
-                error_list.append(self.error_recv.receive_nowait())
-        except trio.WouldBlock:
-            pass
+        # (Read exactly the buffered errors, no WouldBlock in common case)
+        nb_errors = self.error_recv.statistics().current_buffer_used
+        error_list = [self.error_recv.receive_nowait()
+                      for counter in range(nb_errors)]
 
         error_type = 1 if error_list else 0
         effective_code = (None if self.__tmp_effective_code.is_empty()
@@ -672,8 +672,7 @@ class ServerInterface(QObject):
 
         :param statement: Statement (most of the time an Exercise)
         """
-        file_content = statement.course.file_content
-        lines        = file_content.splitlines()
+        lines        = statement.course.file_lines
         begin_line   = statement.lean_begin_line_number
 
         # Construct short end of file by closing all open namespaces
@@ -64,33 +64,30 @@ class CourseData:
         Add "hypo/target analysis" at relevant places, once for each
         statement to be processed.
         """
-        lines        = self.course.file_content.splitlines()
+        lines        = self.course.file_lines
         hypo_tactic    = "    hypo_analysis,"
         targets_tactic = "    targets_analysis,"
 
-        shift = 0  # Shift due to line insertion/deletion
-        for statement in self.statements:
-            # self.log.debug(f"Statement n° {self.statements.index(
-            # statement)}")
-            begin_line   = statement.lean_begin_line_number + shift
-            end_line     = statement.lean_end_line_number + shift
-            # self.log.debug(f"{len(lines)} lines")
-            # self.log.debug(f"begin, end =  {begin_line, end_line}")
-            proof_lines = list(range(begin_line, end_line-1))
-            # self.log.debug(proof_lines)
-            proof_lines.reverse()
-            for index in proof_lines:
-                lines.pop(index)
-            lines.insert(begin_line, hypo_tactic)
-            lines.insert(begin_line+1, targets_tactic)
-            self.statement_from_hypo_line[begin_line+1] = statement
-            self.statement_from_targets_line[begin_line+2] = statement
-            # No shift if end_line = begin_line + 3
-            shift += 3 - (end_line - begin_line)
-            # self.log.debug(f"Shift: {shift}")
-            # Construct virtual file
-
-        file_contents = "\n".join(lines)
+        # Build the virtual file in one pass: copy the lines up to each
+        # proof, replace the proof by the two tactics, and go on.
+        new_lines = []
+        cursor = 0  # Index in lines of the first line not yet copied
+        statements = sorted(self.statements,
+                            key=lambda st: st.lean_begin_line_number)
+        for statement in statements:
+            begin_line = statement.lean_begin_line_number
+            end_line   = statement.lean_end_line_number
+            new_lines.extend(lines[cursor:begin_line])
+            hypo_line = len(new_lines) + 1
+            new_lines.append(hypo_tactic)
+            new_lines.append(targets_tactic)
+            self.statement_from_hypo_line[hypo_line] = statement
+            self.statement_from_targets_line[hypo_line+1] = statement
+            # Skip proof lines, i.e. lines[begin_line:end_line-1]
+            cursor = max(begin_line, end_line - 1)
+        new_lines.extend(lines[cursor:])
+
+        file_contents = "\n".join(new_lines)
         # print(file_contents)
         return file_contents
 
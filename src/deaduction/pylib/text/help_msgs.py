@@ -29,6 +29,8 @@ This file is part of d∃∀duction.
     with dEAduction.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from functools import lru_cache
+
 # import deaduction.pylib.config.vars as cvars
 # from deaduction.pylib.math_display.utils import replace_dubious_characters
 
@@ -287,17 +289,23 @@ def conc_n_trans(msgs) -> str:
     return msg
 
 
+@lru_cache(maxsize=None)
+def translated_help_msgs(key: str, target: bool) -> tuple:
+    """
+    Concatenate and translate the msgs of key in the use or prove dict.
+    The translation function tr is fixed at import, so the result is
+    computed only once per key.
+    """
+    dic = prove if target else use
+    return tuple(conc_n_trans(msg) for msg in dic.get(key, []))
+
+
 def get_help_msgs(key: str, target=False) -> []:
     """
     Return the content of the use and prove dict after concatenation into 3
     msgs, and translations.
     """
-    dic = prove if target else use
-    msgs = dic.get(key, [])
-    tr_msgs = []
-    for msg in msgs:
-        tr_msgs.append(conc_n_trans(msg))
-    return tr_msgs
+    return list(translated_help_msgs(key, bool(target)))
 
 
 # use["unfold_implicit_def"] = _("To see this property explicitly as a {"
@@ -0,0 +1,50 @@
+"""
+# test_logic.py : test logic actions #
+
+Author(s)     : Frédéric Le Roux frederic.le-roux@imj-prg.fr
+Maintainer(s) : Frédéric Le Roux frederic.le-roux@imj-prg.fr
+Created       : 11 2020 (creation)
+Repo          : https://github.com/dEAduction/dEAduction
+
+Copyright (c) 2020 the d∃∀duction team
+
+This file is part of d∃∀duction.
+
+    d∃∀duction is free software: you can redistribute it and/or modify it under
+    the terms of the GNU General Public License as published by the Free
+    Software Foundation, either version 3 of the License, or (at your option)
+    any later version.
+
+    d∃∀duction is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+    more details.
+
+    You should have received a copy of the GNU General Public License along
+    with dEAduction.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from deaduction.pylib.actions.logic import have_new_property
+from deaduction.pylib.mathobj import MathObject
+
+
+def test_have_new_property():
+    """
+    Test the order of the or_else alternatives of have_new_property:
+    up to 4 placeholders without '@', then up to 4 placeholders with '@'.
+    """
+    arrow = MathObject(node="LOCAL_CONSTANT",
+                       info={'name': "H"},
+                       children=[])
+    code = have_new_property(arrow, ["x", "y"], "H2", success_msg="")
+    strings = [instruction.to_code() for instruction in code.instructions]
+    assert strings == ["have H2 := H x y",
+                       "have H2 := H _ x y",
+                       "have H2 := H _ _ x y",
+                       "have H2 := H _ _ _ x y",
+                       "have H2 := H _ _ _ _ x y",
+                       "have H2 := @H x y",
+                       "have H2 := @H _ x y",
+                       "have H2 := @H _ _ x y",
+                       "have H2 := @H _ _ _ x y",
+                       "have H2 := @H _ _ _ _ x y"]